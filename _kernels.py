@@ -0,0 +1,43 @@
+"""
+Numeric kernels for the Mock Cognition Engine
+JIT-compiled with Numba when it is installed, plain Python otherwise
+"""
+
+from typing import Sequence, Tuple
+
+try:
+    import numpy as np  # type: ignore[import-not-found]
+    from numba import njit  # type: ignore[import-not-found]
+except ImportError:
+    np = None  # type: ignore[assignment]
+    njit = None  # type: ignore[assignment]
+
+
+def _decide_kernel(temps, base: float) -> Tuple[int, int]:
+    """
+    Count temperatures above base and locate the coolest of them
+    Returns (count_above, index_of_coolest_above), index is -1 if none
+    """
+    count = 0
+    best = -1
+    best_temp = base  # Placeholder, only read once best != -1
+    for i in range(len(temps)):
+        t = temps[i]
+        if t > base:
+            count += 1
+            if best == -1 or t < best_temp:
+                best_temp = t
+                best = i
+    return count, best
+
+
+if njit is not None:
+    # cache=True keeps the compiled kernel on disk across runs
+    _decide_kernel_jit = njit(cache=True)(_decide_kernel)
+
+    def decide_kernel(temps: Sequence[float], base: float) -> Tuple[int, int]:
+        """Numba-compiled variant of _decide_kernel"""
+        count, best = _decide_kernel_jit(np.asarray(temps, dtype=np.float64), float(base))
+        return int(count), int(best)
+else:
+    decide_kernel = _decide_kernel
@@ -0,0 +1,31 @@
+"""
+Control-plane rule checks for the MetaPrompt
+Fully typed so it can be compiled in place with mypyc (`mypyc _validate.py`);
+the resulting extension module is imported ahead of this pure-Python file
+"""
+
+from typing import Any, List, Mapping, Tuple
+
+_PASS: Tuple[bool, str] = (True, "PASS")
+
+
+def check_output(cognition_output: Mapping[str, Any], require_citations: bool) -> Tuple[bool, str]:
+    """Validate Cognition output against the evidence and final-action rules"""
+    get = cognition_output.get
+
+    # Check evidence citation
+    missing_evidence: bool = require_citations and not get("evidence_refs")
+
+    # Check final action constraint
+    unvalidated_final: bool = bool(get("is_final_action")) and not get("control_validated")
+
+    if not (missing_evidence or unvalidated_final):
+        return _PASS
+
+    issues: List[str] = []
+    if missing_evidence:
+        issues.append("Missing evidence citations")
+    if unvalidated_final:
+        issues.append("Final action without Control validation")
+
+    return False, f"VIOLATIONS: {'; '.join(issues)}"
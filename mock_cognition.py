@@ -5,8 +5,122 @@ In production, replace with actual LLM API calls
 """
 
 import json
+import logging
 import re
-from typing import Dict, Any, List
+import sys
+import functools
+from typing import Dict, Any, List, Tuple
+
+from _kernels import decide_kernel
+
+
+# Engine progress is logged at INFO and discarded unless logging is configured
+logger = logging.getLogger(__name__)
+
+# City names and evidence IDs, interned so set/dict lookups hit the
+# identity fast path
+_SF = sys.intern("San Francisco")
+_MIA = sys.intern("Miami")
+_ATL = sys.intern("Atlanta")
+
+_WEATHER_SF = sys.intern("weather_sf")
+_WEATHER_MIAMI = sys.intern("weather_miami")
+_WEATHER_ATLANTA = sys.intern("weather_atlanta")
+
+# Shared (immutable) evidence_refs values
+_RETRIEVAL_REFS = ("retrieval_plan",)
+_EVIDENCE_REFS = (_WEATHER_SF, _WEATHER_MIAMI, _WEATHER_ATLANTA)
+
+# Map evidence keys to actual city names
+_CITY_MAP = {
+    "SF_weather": _SF,
+    "Miami_weather": _MIA,
+    "Atlanta_weather": _ATL
+}
+
+# Field order of the normalized weather records used as decision cache keys
+_WEATHER_FIELDS = ("city", "temperature_f", "condition", "precipitation_chance")
+
+# Per-city reading used in the all-below reasoning
+_TEMP_READING = "{city}={temperature_f}°F"
+
+# Fields shared by every response of a decision branch
+_ALL_ABOVE_TEMPLATE = {
+    "evidence_refs": _EVIDENCE_REFS,
+    "decision_branch": "all_above_threshold",
+    "is_final_action": True,
+    "control_validated": False
+}
+_TWO_ABOVE_TEMPLATE = {
+    "evidence_refs": _EVIDENCE_REFS,
+    "decision_branch": "two_above_threshold",
+    "is_final_action": True,
+    "control_validated": False
+}
+_ONE_ABOVE_TEMPLATE = {
+    "evidence_refs": _EVIDENCE_REFS,
+    "decision_branch": "one_above_threshold",
+    "is_final_action": True,
+    "control_validated": False
+}
+_ALL_BELOW_TEMPLATE = {
+    "evidence_refs": _EVIDENCE_REFS,
+    "decision_branch": "all_below_threshold",
+    "is_final_action": False,  # Need to recommend snacks next
+    "control_validated": False
+}
+
+# Decision branches indexed by the number of cities above base temperature:
+# (response template, tool_name, reasoning template, parameter templates)
+_DECISION_TABLE = {
+    3: (
+        _ALL_ABOVE_TEMPLATE,
+        "generate_image",
+        "All three cities are above base temperature {base_temp}°F. Per task specification, travel to coolest: {city} at {temp}°F. Will generate weather image.",
+        {
+            "description": "{city} weather: {condition}, {temp}°F"
+        }
+    ),
+    2: (
+        _TWO_ABOVE_TEMPLATE,
+        "send_email",
+        "Two cities above base temperature: {above_cities}. Per task specification, choose cooler ({city} at {temp}°F) and send email notification.",
+        {
+            "recipient": "test-scl@test.com",
+            "subject": "Travel Plan Confirmed: {city}",
+            "body": "Based on weather analysis, traveling to {city}. Temperature: {temp}°F, Condition: {condition}. {umbrella}."
+        }
+    ),
+    1: (
+        _ONE_ABOVE_TEMPLATE,
+        "send_email",
+        "Only {city} is above base temperature ({temp}°F > {base_temp}°F). Per task specification, travel to that location.",
+        {
+            "recipient": "test-scl@test.com",
+            "subject": "Travel Plan: {city}",
+            "body": "Traveling to {city}. Temperature: {temp}°F. {umbrella}."
+        }
+    ),
+    0: (
+        _ALL_BELOW_TEMPLATE,
+        "cancel_trip",
+        "All cities are at or below base temperature {base_temp}°F: {temps_str}. Per task specification, cancel trip and recommend convenience store snacks.",
+        {
+            "reason": "All destinations below comfortable temperature threshold"
+        }
+    ),
+}
+
+
+def _copy_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a response down to its proposed_action parameters"""
+    response = dict(response)
+    action = response.get("proposed_action")
+    if action is not None:
+        action = response["proposed_action"] = dict(action)
+        if "parameters" in action:
+            action["parameters"] = dict(action["parameters"])
+    return response
 
 
 class MockCognitionEngine:
@@ -17,7 +131,7 @@ class MockCognitionEngine:
     
     def __init__(self):
         self.call_count = 0
-        self.collected_weather = []  # Track collected weather data
+        self.collected_weather: Dict[str, Dict[str, Any]] = {}  # Collected weather by city
         
     def __call__(self, prompt: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -30,17 +144,14 @@ class MockCognitionEngine:
         state_summary = context.get("retrieval_plan", {})
         last_action_result = context.get("last_action_result", {})
         
+        # Absorb weather gathered outside the loop (e.g. a replayed plan)
+        for result in context.get("prefetched_evidence", ()):
+            if "temperature_f" in result:
+                self.store_weather(result.get("city"), result)
+        
         # Track collected weather by checking last_action_result
         if last_action_result and "temperature_f" in last_action_result:
-            city = last_action_result.get("city")
-            temp = last_action_result.get("temperature_f")
-            
-            # Only add if not already collected (avoid duplicates)
-            if city and temp is not None:
-                existing_cities = [w.get("city") for w in self.collected_weather]
-                if city not in existing_cities:
-                    self.collected_weather.append(last_action_result)
-                    print(f"   [Cognition Engine] Stored weather for {city}: {temp}°F")
+            self.store_weather(last_action_result.get("city"), last_action_result)
         
         # Determine current phase of task
         evidence_needed = state_summary.get("evidence_needed", [])
@@ -51,34 +162,35 @@ class MockCognitionEngine:
             return self._generate_weather_query(evidence_needed, self.collected_weather)
         
         # Phase 2: Analyze and make decision
-        return self._generate_decision(self.collected_weather, base_temp)
+        return self._generate_decision(list(self.collected_weather.values()), base_temp)
+    
+    def store_weather(self, city: str, data: Dict[str, Any]):
+        """Record a get_weather result (e.g. prefetched outside the loop)"""
+        temp = data.get("temperature_f")
+        
+        # Only add if not already collected (avoid duplicates)
+        if city and temp is not None:
+            if city not in self.collected_weather:
+                self.collected_weather[city] = data
+                logger.info("   [Cognition Engine] Stored weather for %s: %s°F", city, temp)
     
     def _generate_weather_query(
         self, 
         cities_needed: List[str], 
-        already_collected: List[Dict]
+        already_collected: Dict[str, Dict[str, Any]]
     ) -> Dict[str, Any]:
         """Generate next weather query action"""
-        collected_cities = [w.get("city") for w in already_collected]
-        
-        # Map evidence keys to actual city names
-        city_map = {
-            "SF_weather": "San Francisco",
-            "Miami_weather": "Miami",
-            "Atlanta_weather": "Atlanta"
-        }
-        
         # Find next city to query
         for city_key in cities_needed:
-            city_name = city_map.get(city_key, city_key)
-            if city_name not in collected_cities:
+            city_name = _CITY_MAP.get(city_key, city_key)
+            if city_name not in already_collected:
                 return {
                     "reasoning": f"Need weather data for {city_name}. Consulting Memory shows no existing data for this city. Will query weather API.",
                     "proposed_action": {
                         "tool_name": "get_weather",
                         "parameters": {"city": city_name}
                     },
-                    "evidence_refs": ["retrieval_plan"],
+                    "evidence_refs": _RETRIEVAL_REFS,
                     "is_final_action": False,
                     "control_validated": False
                 }
@@ -87,7 +199,7 @@ class MockCognitionEngine:
         return {
             "reasoning": "All weather data collected. Ready to analyze and make travel decision.",
             "proposed_action": None,
-            "evidence_refs": ["weather_sf", "weather_miami", "weather_atlanta"],
+            "evidence_refs": _EVIDENCE_REFS,
             "is_final_action": False
         }
     
@@ -100,7 +212,7 @@ class MockCognitionEngine:
         Generate final decision based on collected weather
         Implements conditional logic from task specification
         """
-        print(f"   [Cognition Engine] Making decision with {len(weather_data)} cities' data")
+        logger.info("   [Cognition Engine] Making decision with %d cities' data", len(weather_data))
         
         # Use actually collected weather data
         if len(weather_data) < 3:
@@ -111,89 +223,121 @@ class MockCognitionEngine:
                 "is_final_action": False
             }
         
-        # Count cities above base temperature
-        above_threshold = [w for w in weather_data if w.get("temperature_f", 0) > base_temp]
+        # Normalize into a hashable snapshot so repeated inputs hit the cache
+        weather_tuple = tuple(
+            (w["city"], w["temperature_f"], w.get("condition"), w.get("precipitation_chance", 0))
+            for w in weather_data
+        )
+        above_count, decision = self._decide(weather_tuple, base_temp)
         
-        print(f"   [Cognition Engine] Cities above {base_temp}°F: {len(above_threshold)}")
+        logger.info("   [Cognition Engine] Cities above %s°F: %d", base_temp, above_count)
         
-        # Apply conditional logic as per task specification
-        if len(above_threshold) == 3:
-            # All three above: go to coolest
-            coolest = min(above_threshold, key=lambda x: x["temperature_f"])
-            return {
-                "reasoning": f"All three cities are above base temperature {base_temp}°F. Per task specification, travel to coolest: {coolest['city']} at {coolest['temperature_f']}°F. Will generate weather image.",
-                "proposed_action": {
-                    "tool_name": "generate_image",
-                    "parameters": {
-                        "description": f"{coolest['city']} weather: {coolest['condition']}, {coolest['temperature_f']}°F"
-                    }
-                },
-                "evidence_refs": ["weather_sf", "weather_miami", "weather_atlanta"],
-                "decision_branch": "all_above_threshold",
-                "is_final_action": True,
-                "control_validated": False,
-                "destination": coolest['city'],
-                "umbrella_needed": coolest.get('precipitation_chance', 0) > 30
-            }
+        # The decision is shared through the process-wide lru_cache; Control
+        # stamps control_validated onto the response, so hand out a copy of
+        # every mutable level (response, proposed_action, parameters)
+        return _copy_response(decision)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _decide(
+        weather_tuple: Tuple[tuple, ...], 
+        base_temp: float
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        Pure decision logic, memoized on (weather snapshot, base temperature)
+        Identical upstream inputs yield identical decisions, so the response is
+        reused much like a KV/prefix cache reuses an already-processed prompt
+        """
+        weather_data = [dict(zip(_WEATHER_FIELDS, w)) for w in weather_tuple]
         
-        elif len(above_threshold) == 2:
-            # Two above: choose cooler and send email
-            cooler = min(above_threshold, key=lambda x: x["temperature_f"])
-            return {
-                "reasoning": f"Two cities above base temperature: {[w['city'] for w in above_threshold]}. Per task specification, choose cooler ({cooler['city']} at {cooler['temperature_f']}°F) and send email notification.",
-                "proposed_action": {
-                    "tool_name": "send_email",
-                    "parameters": {
-                        "recipient": "test-scl@test.com",
-                        "subject": f"Travel Plan Confirmed: {cooler['city']}",
-                        "body": f"Based on weather analysis, traveling to {cooler['city']}. Temperature: {cooler['temperature_f']}°F, Condition: {cooler['condition']}. {'Bring umbrella' if cooler.get('precipitation_chance', 0) > 30 else 'No umbrella needed'}."
-                    }
-                },
-                "evidence_refs": ["weather_sf", "weather_miami", "weather_atlanta"],
-                "decision_branch": "two_above_threshold",
-                "is_final_action": True,
-                "control_validated": False,
-                "destination": cooler['city'],
-                "umbrella_needed": cooler.get('precipitation_chance', 0) > 30
-            }
+        # Count cities above base temperature and locate the coolest of them
+        above_count, coolest_idx = decide_kernel(
+            [w["temperature_f"] for w in weather_data], base_temp
+        )
+        coolest = weather_data[coolest_idx] if coolest_idx >= 0 else None
         
-        elif len(above_threshold) == 1:
-            # One above: go there
-            destination = above_threshold[0]
-            return {
-                "reasoning": f"Only {destination['city']} is above base temperature ({destination['temperature_f']}°F > {base_temp}°F). Per task specification, travel to that location.",
-                "proposed_action": {
-                    "tool_name": "send_email",
-                    "parameters": {
-                        "recipient": "test-scl@test.com",
-                        "subject": f"Travel Plan: {destination['city']}",
-                        "body": f"Traveling to {destination['city']}. Temperature: {destination['temperature_f']}°F. {'Bring umbrella' if destination.get('precipitation_chance', 0) > 30 else 'No umbrella needed'}."
-                    }
-                },
-                "evidence_refs": ["weather_sf", "weather_miami", "weather_atlanta"],
-                "decision_branch": "one_above_threshold",
-                "is_final_action": True,
-                "control_validated": False,
-                "destination": destination['city'],
-                "umbrella_needed": destination.get('precipitation_chance', 0) > 30
-            }
+        # Apply conditional logic as per task specification
+        template, tool_name, reasoning, parameters = _DECISION_TABLE.get(
+            above_count, _DECISION_TABLE[0]
+        )
         
+        fields: Dict[str, Any] = {"base_temp": base_temp}
+        travelling = tool_name != "cancel_trip"
+        umbrella_needed = False
+        if travelling:
+            # Travel to the coolest city above threshold (exists when count > 0)
+            assert coolest is not None
+            umbrella_needed = coolest["precipitation_chance"] > 30
+            fields.update(
+                city=coolest["city"],
+                temp=coolest["temperature_f"],
+                condition=coolest["condition"],
+                umbrella="Bring umbrella" if umbrella_needed else "No umbrella needed",
+                above_cities=[w["city"] for w in weather_data if w["temperature_f"] > base_temp]
+            )
         else:
             # None above: cancel and recommend snacks
-            temps_str = ", ".join([f"{w['city']}={w['temperature_f']}°F" for w in weather_data])
-            return {
-                "reasoning": f"All cities are at or below base temperature {base_temp}°F: {temps_str}. Per task specification, cancel trip and recommend convenience store snacks.",
-                "proposed_action": {
-                    "tool_name": "cancel_trip",
-                    "parameters": {
-                        "reason": "All destinations below comfortable temperature threshold"
-                    }
-                },
-                "evidence_refs": ["weather_sf", "weather_miami", "weather_atlanta"],
-                "decision_branch": "all_below_threshold",
-                "is_final_action": False,  # Need to recommend snacks next
-                "control_validated": False
-            }
+            fields["temps_str"] = ", ".join([_TEMP_READING.format_map(w) for w in weather_data])
+        
+        decision = {
+            "reasoning": reasoning.format_map(fields),
+            "proposed_action": {
+                "tool_name": tool_name,
+                "parameters": {k: v.format_map(fields) for k, v in parameters.items()}
+            },
+            **template
+        }
+        if travelling:
+            decision["destination"] = fields["city"]
+            decision["umbrella_needed"] = umbrella_needed
+        
+        return above_count, decision
+
+
+# SimplifiedCognitionEngine phases: (city to collect, response requesting it)
+_SIMPLIFIED_PHASES = (
+    (_SF, {
+        "reasoning": "Need San Francisco weather data first",
+        "proposed_action": {
+            "tool_name": "get_weather",
+            "parameters": {"city": _SF}
+        },
+        "evidence_refs": (),
+        "is_final_action": False
+    }),
+    (_MIA, {
+        "reasoning": "Need Miami weather data",
+        "proposed_action": {
+            "tool_name": "get_weather",
+            "parameters": {"city": _MIA}
+        },
+        "evidence_refs": (_WEATHER_SF,),
+        "is_final_action": False
+    }),
+    (_ATL, {
+        "reasoning": "Need Atlanta weather data",
+        "proposed_action": {
+            "tool_name": "get_weather",
+            "parameters": {"city": _ATL}
+        },
+        "evidence_refs": (_WEATHER_SF, _WEATHER_MIAMI),
+        "is_final_action": False
+    }),
+)
+
+_SIMPLIFIED_DECISION = {
+    "reasoning": "All weather data collected. Making travel decision based on temperatures.",
+    "proposed_action": {
+        "tool_name": "send_email",
+        "parameters": {
+            "recipient": "test-scl@test.com",
+            "subject": "Travel Decision",
+            "body": "Decision made based on weather analysis."
+        }
+    },
+    "evidence_refs": _EVIDENCE_REFS,
+    "is_final_action": True
+}
 
 
 class SimplifiedCognitionEngine:
@@ -209,56 +353,13 @@ class SimplifiedCognitionEngine:
     def __call__(self, prompt: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """State machine implementation"""
         
-        # Phase 1: Collect San Francisco weather
-        if "San Francisco" not in self.weather_data:
-            return {
-                "reasoning": "Need San Francisco weather data first",
-                "proposed_action": {
-                    "tool_name": "get_weather",
-                    "parameters": {"city": "San Francisco"}
-                },
-                "evidence_refs": [],
-                "is_final_action": False
-            }
-        
-        # Phase 2: Collect Miami weather
-        if "Miami" not in self.weather_data:
-            return {
-                "reasoning": "Need Miami weather data",
-                "proposed_action": {
-                    "tool_name": "get_weather",
-                    "parameters": {"city": "Miami"}
-                },
-                "evidence_refs": ["weather_sf"],
-                "is_final_action": False
-            }
-        
-        # Phase 3: Collect Atlanta weather
-        if "Atlanta" not in self.weather_data:
-            return {
-                "reasoning": "Need Atlanta weather data",
-                "proposed_action": {
-                    "tool_name": "get_weather",
-                    "parameters": {"city": "Atlanta"}
-                },
-                "evidence_refs": ["weather_sf", "weather_miami"],
-                "is_final_action": False
-            }
+        # Phases 1-3: Collect weather for the first city still missing
+        for city, response in _SIMPLIFIED_PHASES:
+            if city not in self.weather_data:
+                return response
         
-        # Phase 4: Make decision
-        return {
-            "reasoning": "All weather data collected. Making travel decision based on temperatures.",
-            "proposed_action": {
-                "tool_name": "send_email",
-                "parameters": {
-                    "recipient": "test-scl@test.com",
-                    "subject": "Travel Decision",
-                    "body": "Decision made based on weather analysis."
-                }
-            },
-            "evidence_refs": ["weather_sf", "weather_miami", "weather_atlanta"],
-            "is_final_action": True
-        }
+        # Phase 4: Make decision (copied, since Control stamps final actions)
+        return dict(_SIMPLIFIED_DECISION)
     
     def store_weather(self, city: str, data: Dict[str, Any]):
         """Helper to update internal state"""
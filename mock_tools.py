@@ -3,31 +3,92 @@ Mock Tool Implementations for Travel Planning Scenario
 Demonstrates tool registration and execution in Structured Cognitive Loop (SCL)
 """
 
+import asyncio
+import logging
+import os
 import random
+import zlib
 from typing import Dict, Any
 
+try:
+    import xxhash  # type: ignore[import-not-found]  # Optional: fast non-cryptographic hashing
+except ImportError:
+    xxhash = None  # type: ignore[assignment]
+
+# Tool output is logged at INFO and discarded unless logging is configured
+logger = logging.getLogger(__name__)
+
+
+def _stable_hash(text: str) -> int:
+    """Deterministic string hash (unlike hash(), unaffected by PYTHONHASHSEED)"""
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(text)
+    return zlib.crc32(text.encode())
+
+
+# Static weather profile per city: (low_temp_f, high_temp_f, condition)
+_WEATHER_BASE = {
+    "San Francisco": (50, 75, "Partly Cloudy"),
+    "Miami": (70, 90, "Sunny"),
+    "Atlanta": (55, 80, "Clear"),
+}
+
+# Dedicated PRNG for mock readings; set SCL_WEATHER_SEED for reproducible runs
+_RNG = random.Random(os.environ.get("SCL_WEATHER_SEED"))
+_randint = _RNG.randint
+
+# API reference slugs, precomputed once per known city
+_API_REFS = {
+    city: f"wx-{city.replace(' ', '').lower()}-001" for city in _WEATHER_BASE
+}
+
+
+# Snack lists per preference (shared, immutable)
+_SNACKS = {
+    "general": (
+        "Honey Butter Chips",
+        "Choco Pie",
+        "Pepero Sticks",
+        "Shin Ramyun Cup",
+        "Market O Brownies"
+    ),
+    "sweet": (
+        "Choco Pie",
+        "Market O Brownies",
+        "Custard Cake",
+        "Pepero Almond",
+        "Crown Sando"
+    ),
+    "savory": (
+        "Honey Butter Chips",
+        "Shin Ramyun Cup",
+        "Squid Peanut Snack",
+        "Turtle Chips",
+        "Seaweed Snack"
+    )
+}
+
+# Numbered snack listings, formatted once per preference
+_SNACK_BANNERS = {
+    k: "\n".join(f"{i}. {snack}" for i, snack in enumerate(v, 1))
+    for k, v in _SNACKS.items()
+}
+
 
 def get_weather(city: str) -> Dict[str, Any]:
     """
     Mock weather API tool
     Returns temperature and condition for specified city
     """
-    # Simulate realistic weather data
-    weather_db = {
-        "San Francisco": {"temp": random.randint(50, 75), "condition": "Partly Cloudy"},
-        "Miami": {"temp": random.randint(70, 90), "condition": "Sunny"},
-        "Atlanta": {"temp": random.randint(55, 80), "condition": "Clear"},
-    }
-    
-    # Add some variability
-    if city in weather_db:
-        base_data = weather_db[city]
+    # Simulate realistic weather data with some variability
+    if city in _WEATHER_BASE:
+        lo, hi, condition = _WEATHER_BASE[city]
         return {
             "city": city,
-            "temperature_f": base_data["temp"] + random.randint(-5, 5),
-            "condition": base_data["condition"],
-            "precipitation_chance": random.randint(0, 50),
-            "api_ref": f"wx-{city.replace(' ', '').lower()}-001"
+            "temperature_f": _randint(lo - 5, hi + 5),
+            "condition": condition,
+            "precipitation_chance": _randint(0, 50),
+            "api_ref": _API_REFS[city]
         }
     else:
         return {
@@ -37,22 +98,29 @@ def get_weather(city: str) -> Dict[str, Any]:
         }
 
 
+async def aget_weather(city: str) -> Dict[str, Any]:
+    """
+    Async wrapper around get_weather
+    Runs the (blocking) lookup in the default executor so several cities can
+    be fetched concurrently; a real API client would await its HTTP call here
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, get_weather, city)
+
+
 def send_email(recipient: str, subject: str, body: str) -> Dict[str, Any]:
     """
     Mock email sending tool
     Logs email instead of actually sending
     """
-    print(f"\n📧 EMAIL SENT")
-    print(f"To: {recipient}")
-    print(f"Subject: {subject}")
-    print(f"Body: {body[:200]}...")
+    logger.info("\n📧 EMAIL SENT\nTo: %s\nSubject: %s\nBody: %s...", recipient, subject, body[:200])
     
     return {
         "status": "sent",
         "recipient": recipient,
         "subject": subject,
         "timestamp": "2024-01-15T10:30:00Z",
-        "message_id": f"msg-{hash(body) % 10000}"
+        "message_id": f"msg-{_stable_hash(body) % 10000}"
     }
 
 
@@ -61,8 +129,7 @@ def generate_image(description: str) -> Dict[str, Any]:
     Mock image generation tool
     Returns a placeholder image reference
     """
-    print(f"\n🖼️  IMAGE GENERATED")
-    print(f"Description: {description}")
+    logger.info("\n🖼️  IMAGE GENERATED\nDescription: %s", description)
     
     return {
         "status": "generated",
@@ -77,8 +144,7 @@ def cancel_trip(reason: str) -> Dict[str, Any]:
     """
     Mock trip cancellation tool
     """
-    print(f"\n✗ TRIP CANCELLED")
-    print(f"Reason: {reason}")
+    logger.info("\n✗ TRIP CANCELLED\nReason: %s", reason)
     
     return {
         "status": "cancelled",
@@ -91,35 +157,10 @@ def recommend_snacks(preferences: str = "general") -> Dict[str, Any]:
     """
     Mock snack recommendation tool
     """
-    snack_lists = {
-        "general": [
-            "Honey Butter Chips",
-            "Choco Pie",
-            "Pepero Sticks",
-            "Shin Ramyun Cup",
-            "Market O Brownies"
-        ],
-        "sweet": [
-            "Choco Pie",
-            "Market O Brownies",
-            "Custard Cake",
-            "Pepero Almond",
-            "Crown Sando"
-        ],
-        "savory": [
-            "Honey Butter Chips",
-            "Shin Ramyun Cup",
-            "Squid Peanut Snack",
-            "Turtle Chips",
-            "Seaweed Snack"
-        ]
-    }
-    
-    snacks = snack_lists.get(preferences, snack_lists["general"])
+    key = preferences if preferences in _SNACKS else "general"
+    snacks = _SNACKS[key]
     
-    print(f"\n🍿 SNACK RECOMMENDATIONS ({preferences})")
-    for i, snack in enumerate(snacks, 1):
-        print(f"{i}. {snack}")
+    logger.info("\n🍿 SNACK RECOMMENDATIONS (%s)\n%s", preferences, _SNACK_BANNERS[key])
     
     return {
         "status": "recommended",
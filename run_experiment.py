@@ -8,14 +8,76 @@ This experiment validates the claims in the paper:
 3. Transparent state management (Memory audit trail)
 """
 
+import asyncio
+import atexit
 import json
-from scl_core import StructuredCognitiveLoop, MetaPrompt, ToolRegistry
+import logging
+import os
+import sys
+from typing import Any, Dict, List, Sequence, Tuple
+from scl_core import (
+    StructuredCognitiveLoop, MetaPrompt, ToolRegistry, start_logging
+)
 from mock_tools import (
-    get_weather, send_email, generate_image, 
+    get_weather, aget_weather, send_email, generate_image, 
     cancel_trip, recommend_snacks, check_umbrella_needed
 )
 from mock_cognition import MockCognitionEngine
 
+try:
+    import orjson  # type: ignore[import-not-found]  # Optional: C-accelerated JSON serialization
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+logger = logging.getLogger(__name__)
+
+# Cities covered by the weather scenario
+WEATHER_CITIES = ("San Francisco", "Miami", "Atlanta")
+
+# Upper bound on concurrent tool calls when prefetching weather
+MAX_CONCURRENT = int(os.environ.get("SCL_MAX_CONCURRENT", "8"))
+
+# Verbose demo output (set SCL_VERBOSE=0 for quiet benchmark sweeps);
+# it only decides whether logging is started, see __main__
+VERBOSE = bool(int(os.environ.get("SCL_VERBOSE", "1")))
+
+# Separator line used in demo output
+_RULE = "=" * 80
+
+
+def _encode_json(value: Any) -> bytes:
+    """Encode a value as indented UTF-8 JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def write_json(data: Any, filename: str):
+    """
+    Write data as indented UTF-8 JSON
+    Top-level lists of a dict (e.g. the execution log) are streamed to the
+    file one entry at a time instead of being serialized as a single string
+    """
+    with open(filename, 'wb') as f:
+        if not isinstance(data, dict) or not data:
+            f.write(_encode_json(data))
+            return
+        
+        separator = b"{\n"
+        for key, value in data.items():
+            f.write(separator + b"  " + _encode_json(str(key)) + b": ")
+            if isinstance(value, list) and value:
+                item_separator = b"[\n    "
+                for item in value:
+                    f.write(item_separator + _encode_json(item).replace(b"\n", b"\n    "))
+                    item_separator = b",\n    "
+                f.write(b"\n  ]")
+            else:
+                f.write(_encode_json(value).replace(b"\n", b"\n  "))
+            separator = b",\n"
+        f.write(b"\n}")
+
 
 def setup_experiment():
     """Initialize SCL system with tools and cognition engine"""
@@ -27,37 +89,88 @@ def setup_experiment():
     tool_registry.register(
         "get_weather",
         get_weather,
-        "Get current weather for a city (temperature, condition, precipitation)"
+        "Get current weather for a city (temperature, condition, precipitation)",
+        {
+            "type": "object",
+            "properties": {
+                "city": {"type": "string"}
+            },
+            "required": ["city"],
+            "additionalProperties": False
+        }
     )
     
     tool_registry.register(
         "send_email",
         send_email,
-        "Send email notification with subject and body"
+        "Send email notification with subject and body",
+        {
+            "type": "object",
+            "properties": {
+                "recipient": {"type": "string"},
+                "subject": {"type": "string"},
+                "body": {"type": "string"}
+            },
+            "required": ["recipient", "subject", "body"],
+            "additionalProperties": False
+        }
     )
     
     tool_registry.register(
         "generate_image",
         generate_image,
-        "Generate weather visualization image from description"
+        "Generate weather visualization image from description",
+        {
+            "type": "object",
+            "properties": {
+                "description": {"type": "string"}
+            },
+            "required": ["description"],
+            "additionalProperties": False
+        }
     )
     
     tool_registry.register(
         "cancel_trip",
         cancel_trip,
-        "Cancel travel plans with specified reason"
+        "Cancel travel plans with specified reason",
+        {
+            "type": "object",
+            "properties": {
+                "reason": {"type": "string"}
+            },
+            "required": ["reason"],
+            "additionalProperties": False
+        }
     )
     
     tool_registry.register(
         "recommend_snacks",
         recommend_snacks,
-        "Get convenience store snack recommendations"
+        "Get convenience store snack recommendations",
+        {
+            "type": "object",
+            "properties": {
+                "preferences": {"type": "string"}
+            },
+            "required": [],
+            "additionalProperties": False
+        }
     )
     
     tool_registry.register(
         "check_umbrella",
         check_umbrella_needed,
-        "Determine if umbrella is needed based on precipitation"
+        "Determine if umbrella is needed based on precipitation",
+        {
+            "type": "object",
+            "properties": {
+                "city": {"type": "string"},
+                "precipitation_chance": {"type": "integer"}
+            },
+            "required": ["city", "precipitation_chance"],
+            "additionalProperties": False
+        }
     )
     
     # 2. Create Metaprompt (Soft Symbolic Control layer)
@@ -77,10 +190,39 @@ def setup_experiment():
     return scl_system
 
 
-def run_weather_scenario():
+async def gather_weather(cities: Sequence[str] = WEATHER_CITIES) -> List[Dict[str, Any]]:
+    """Fetch weather for all cities concurrently (bounded by MAX_CONCURRENT)"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+    
+    async def fetch(city: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await aget_weather(city)
+    
+    return await asyncio.gather(*(fetch(c) for c in cities))
+
+
+def prefetch_weather(cities: Sequence[str] = WEATHER_CITIES):
+    """
+    Plan (in the JITPlanner.compile format) that collects the independent
+    weather lookups in one concurrent batch
+    StructuredCognitiveLoop.run replays it right after Retrieval, storing the
+    results as Memory evidence with an Action trace per call and handing them
+    to the cognition engine, so the CCAM loop can go straight to the decision
+    """
+    def plan(tools: ToolRegistry) -> List[Tuple[str, Dict[str, Any], Any]]:
+        results = asyncio.run(gather_weather(cities))
+        return [("get_weather", {"city": city}, result) for city, result in zip(cities, results)]
+    
+    return plan
+
+
+def run_weather_scenario(prefetch: bool = False):
     """
     Run the main weather-based travel planning scenario
     This demonstrates the full R-CCAM loop
+    
+    With prefetch=True the three weather lookups are issued concurrently
+    after Retrieval instead of one per CCAM cycle
     """
     
     # The exact task specification from the paper example
@@ -101,18 +243,17 @@ def run_weather_scenario():
     a trip is decided.
     """
     
-    print("\n" + "="*80)
-    print("STRUCTURED COGNITIVE LOOP (SCL) EXPERIMENT")
-    print("Weather-Based Travel Planning")
-    print("="*80)
-    print(f"\nTask: {task.strip()}")
-    print("\n" + "="*80 + "\n")
+    logger.info(
+        "\n%s\nSTRUCTURED COGNITIVE LOOP (SCL) EXPERIMENT\nWeather-Based Travel Planning\n%s"
+        "\n\nTask: %s\n\n%s\n",
+        _RULE, _RULE, task.strip(), _RULE
+    )
     
     # Setup system
     system = setup_experiment()
     
     # Run task
-    audit_report = system.run(task)
+    audit_report = system.run(task, plan=prefetch_weather() if prefetch else None)
     
     return audit_report
 
@@ -135,10 +276,9 @@ def save_experiment_results(audit_report: dict, filename: str = "experiment_resu
     }
     
     # Save to file
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(formatted_report, f, indent=2, ensure_ascii=False)
+    write_json(formatted_report, filename)
     
-    print(f"\n✅ Experiment results saved to: {filename}")
+    logger.info("\n✅ Experiment results saved to: %s", filename)
     
     return formatted_report
 
@@ -148,11 +288,9 @@ def generate_paper_figure(audit_report: dict):
     Generate a simplified execution trace similar to Figure 2 in the paper
     """
     
-    print("\n" + "="*80)
-    print("EXECUTION TRACE (Figure 2 Format)")
-    print("="*80 + "\n")
+    logger.info("\n%s\nEXECUTION TRACE (Figure 2 Format)\n%s\n", _RULE, _RULE)
     
-    trace = {
+    trace: Dict[str, Any] = {
         "task": "Check San Francisco, Miami, and Atlanta weather; apply branching rule",
         "policies": [
             "must_cite_stored_evidence",
@@ -162,19 +300,25 @@ def generate_paper_figure(audit_report: dict):
         "log": []
     }
     
-    # Simplified log entries
-    for entry in audit_report["log"]:
-        if entry["module"] == "Retrieval":
-            trace["log"].append({
+    # Simplified log entries, classified in a single pass over the audit log
+    log = audit_report["log"]
+    trace_log: List[Dict[str, Any]] = trace["log"]
+    for entry in log:
+        module = entry["module"]
+        if module == "Retrieval":
+            trace_log.append({
                 "loop": "init",
                 "module": "Retrieval",
                 "res": {"need": ["SF weather", "Miami weather", "Atlanta weather"], "threshold_hot_F": 55}
             })
         
-        elif entry["module"] == "Action" and "get_weather" in str(entry.get("input_state", {})):
-            city = entry["input_state"].get("parameters", {}).get("city", "Unknown")
+        elif module == "Action":
+            action = entry.get("input_state", {})
+            if action.get("tool_name") != "get_weather":
+                continue
+            city = action.get("parameters", {}).get("city", "Unknown")
             result = entry["output_state"].get("result", {})
-            trace["log"].append({
+            trace_log.append({
                 "loop": city,
                 "phases": ["Cognition", "Control", "Action", "Memory"],
                 "res": {
@@ -185,13 +329,13 @@ def generate_paper_figure(audit_report: dict):
             })
     
     # Add decision phase
-    final_entry = audit_report["log"][-1] if audit_report["log"] else {}
+    final_entry = log[-1] if log else {}
     if "output_state" in final_entry:
         result = final_entry["output_state"].get("result", {})
-        trace["log"].append({
+        trace_log.append({
             "loop": "integrate",
             "phases": ["Cognition", "Control", "Action", "Memory"],
-            "decision": str(result),
+            "decision": result,
             "evidence": ["api:wx-001", "api:wx-002", "api:wx-003"]
         })
     
@@ -201,13 +345,13 @@ def generate_paper_figure(audit_report: dict):
     }
     
     # Print formatted
-    print(json.dumps(trace, indent=2))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("%s", json.dumps(trace, indent=2))
     
     # Save
-    with open("paper_figure_trace.json", 'w') as f:
-        json.dump(trace, f, indent=2)
+    write_json(trace, "paper_figure_trace.json")
     
-    print(f"\n✅ Paper-format trace saved to: paper_figure_trace.json")
+    logger.info("\n✅ Paper-format trace saved to: %s", "paper_figure_trace.json")
 
 
 def print_summary_statistics(audit_report: dict):
@@ -215,31 +359,43 @@ def print_summary_statistics(audit_report: dict):
     
     summary = audit_report["summary"]
     
-    print("\n" + "="*80)
-    print("EXPERIMENT SUMMARY STATISTICS")
-    print("="*80)
+    logger.info("\n%s\nEXPERIMENT SUMMARY STATISTICS\n%s", _RULE, _RULE)
     
-    print(f"\n📊 Performance Metrics:")
-    print(f"   • Total CCAM loops: {summary['total_loops']}")
-    print(f"   • Policy violations: {summary['policy_violations']}")
-    print(f"   • Success rate: {100 * (1 - summary['policy_violations'] / max(summary['total_loops'], 1)):.1f}%")
+    logger.info(
+        "\n📊 Performance Metrics:\n"
+        "   • Total CCAM loops: %d\n"
+        "   • Policy violations: %d\n"
+        "   • Success rate: %.1f%%",
+        summary['total_loops'], summary['policy_violations'],
+        100 * (1 - summary['policy_violations'] / max(summary['total_loops'], 1))
+    )
     
-    print(f"\n🔧 Architecture Validation:")
-    print(f"   ✓ Modular decomposition maintained")
-    print(f"   ✓ Soft Symbolic Control enforced")
-    print(f"   ✓ Memory persistence across loops")
-    print(f"   ✓ Transparent audit trail generated")
+    logger.info(
+        "\n🔧 Architecture Validation:\n"
+        "   ✓ Modular decomposition maintained\n"
+        "   ✓ Soft Symbolic Control enforced\n"
+        "   ✓ Memory persistence across loops\n"
+        "   ✓ Transparent audit trail generated"
+    )
     
-    print(f"\n📝 Final State:")
-    for key, value in summary['final_state']['stored_values'].items():
-        print(f"   • {key}: {str(value)[:80]}")
+    logger.info("\n📝 Final State:")
+    if logger.isEnabledFor(logging.INFO):
+        for key, value in summary['final_state']['stored_values'].items():
+            logger.info("   • %s: %s", key, str(value)[:80])
     
-    print("\n" + "="*80 + "\n")
+    logger.info("\n%s\n", _RULE)
 
 
 if __name__ == "__main__":
+    # Emit loop, tool and engine progress from a background logging thread;
+    # the listener is stopped (and its queue flushed) at interpreter exit
+    if VERBOSE:
+        atexit.register(start_logging(stream=sys.stdout).stop)
+    
     # Run the experiment
-    audit_report = run_weather_scenario()
+    audit_report = run_weather_scenario(
+        prefetch=os.environ.get("SCL_PREFETCH_WEATHER", "0") == "1"
+    )
     
     # Save results
     formatted_report = save_experiment_results(audit_report)
@@ -250,8 +406,10 @@ if __name__ == "__main__":
     # Print statistics
     print_summary_statistics(audit_report)
     
-    print("\n✅ Experiment complete!")
-    print("\nGenerated files:")
-    print("  • experiment_results.json      - Full audit log")
-    print("  • paper_figure_trace.json      - Simplified trace (Figure 2 format)")
-    print("\nThese files can be used to validate the claims in Section 4 of the paper.")
+    logger.info(
+        "\n✅ Experiment complete!\n"
+        "\nGenerated files:\n"
+        "  • experiment_results.json      - Full audit log\n"
+        "  • paper_figure_trace.json      - Simplified trace (Figure 2 format)\n"
+        "\nThese files can be used to validate the claims in Section 4 of the paper."
+    )
@@ -3,13 +3,207 @@ Structured Cognitive Loop (SCL) Core Implementation
 Demonstrates the Retrieval-Cognition-Control-Action-Memory (R-CCAM) loop
 """
 
+import hashlib
 import json
+import logging
+import queue
+import sys
 import time
-from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
+from typing import Deque, Dict, List, Any, Mapping, Optional, Callable, Iterable, Tuple, TypedDict, Union
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from enum import Enum
 
+try:
+    import orjson  # type: ignore[import-not-found]  # Optional: C-accelerated JSON serialization
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgspec  # type: ignore[import-not-found]  # Optional: C-accelerated JSON encoding for prompts
+except ImportError:
+    msgspec = None  # type: ignore[assignment]
+
+try:
+    import fastjsonschema  # type: ignore[import-not-found]  # Optional: compiled JSON-Schema validation
+except ImportError:
+    fastjsonschema = None  # type: ignore[assignment]
+
+from _validate import check_output  # mypyc-compiled when built, see _validate.py
+
+
+# Loop progress is logged at INFO; nothing is emitted unless logging is configured
+logger = logging.getLogger(__name__)
+
+# Separator lines used in progress output
+_RULE_EQ = "=" * 60
+_RULE_DASH = "─" * 60
+_RULE_HASH = "#" * 60
+
+
+def start_logging(level: int = logging.INFO, stream=None) -> QueueListener:
+    """
+    Route log output through a queue drained by a background thread
+    Callers on the loop's critical path only enqueue records; the returned
+    listener does the (potentially slow) terminal I/O and must be stopped
+    to flush pending output
+    """
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, handler)
+    
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+    
+    listener.start()
+    return listener
+
+
+def _ts() -> int:
+    """Cheap wall-clock timestamp (ns since epoch); formatted only on export"""
+    return time.time_ns()
+
+
+def _format_ts(ts: int) -> str:
+    """Render a _ts() timestamp as ISO 8601 (UTC)"""
+    return datetime.fromtimestamp(ts / 1e9, tz=timezone.utc).isoformat()
+
+
+# orjson options shared by every call site; OPT_NON_STR_KEYS matches the
+# stdlib's acceptance of int/float/bool/None dict keys
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def _dumps_pretty(obj: Any) -> str:
+    """
+    Serialize obj as 2-space indented JSON for prompt construction
+    The C encoders are tried first; anything they reject (e.g. dict keys
+    outside their supported set) falls through to the stdlib encoder, so
+    every backend accepts the same inputs
+    """
+    if msgspec is not None:
+        try:
+            return msgspec.json.format(msgspec.json.encode(obj), indent=2).decode()
+        except (TypeError, msgspec.EncodeError):
+            pass
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTS | orjson.OPT_INDENT_2).decode()
+        except TypeError:
+            pass
+    # Non-ASCII kept verbatim, as the C encoders emit it
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def _dumps_line(obj: Any) -> bytes:
+    """Serialize obj as one compact JSON line (for JSONL audit streams)"""
+    # Tool results may hold sets, datetimes, ...; stringify rather than drop the line
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=_ORJSON_OPTS | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=str) + "\n").encode()
+
+
+def make_evidence_id(tool_name: str, parameters: Dict[str, Any]) -> str:
+    """Canonical Memory evidence ID for a tool call"""
+    if orjson is not None:
+        canonical = orjson.dumps(parameters, option=orjson.OPT_SORT_KEYS).decode()
+    else:
+        # Same compact, key-sorted form orjson produces
+        canonical = json.dumps(parameters, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return f"evidence_{tool_name}_{canonical}"
+
+
+# JSON-Schema type names understood by the built-in validator
+_SCHEMA_TYPES: Dict[str, Union[type, Tuple[type, ...]]] = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "object": dict,
+    "array": (list, tuple),
+    "null": type(None),
+}
+
+# Keywords the built-in validator enforces, plus annotations it may ignore;
+# anything else is rejected so a schema never validates differently with and
+# without fastjsonschema
+_SCHEMA_ANNOTATIONS = frozenset({"$schema", "$id", "title", "description", "default", "examples"})
+_SCHEMA_KEYWORDS = frozenset({"type", "required", "properties", "additionalProperties"}) | _SCHEMA_ANNOTATIONS
+_PROPERTY_KEYWORDS = frozenset({"type"}) | _SCHEMA_ANNOTATIONS
+
+
+def _schema_type_ok(value: Any, type_name: Any) -> bool:
+    """Check a value against a JSON-Schema type name or list of names"""
+    if isinstance(type_name, list):
+        return any(_schema_type_ok(value, t) for t in type_name)
+    # bool is not a number; integral floats (30.0) are integers, as in JSON-Schema
+    if isinstance(value, bool):
+        return type_name == "boolean"
+    if type_name == "integer" and isinstance(value, float):
+        return value.is_integer()
+    return isinstance(value, _SCHEMA_TYPES[type_name])
+
+
+def _check_schema_subset(schema: Dict[str, Any]):
+    """Raise ValueError if schema uses keywords the built-in validator lacks"""
+    unsupported = set(schema) - _SCHEMA_KEYWORDS
+    if schema.get("additionalProperties", False) not in (True, False):
+        unsupported.add("additionalProperties (schema form)")
+    for name, prop in schema.get("properties", {}).items():
+        unsupported.update(f"properties.{name}.{k}" for k in set(prop) - _PROPERTY_KEYWORDS)
+    types = [schema.get("type")] + [p.get("type") for p in schema.get("properties", {}).values()]
+    for t in types:
+        for name in (t if isinstance(t, list) else [t]):
+            if name is not None and name not in _SCHEMA_TYPES:
+                unsupported.add(f"type {name!r}")
+    if unsupported:
+        raise ValueError(
+            f"Schema keywords not supported without fastjsonschema: {sorted(unsupported)}"
+        )
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Compile a parameter JSON-Schema into a validator (raises ValueError)
+    Uses fastjsonschema when installed; otherwise supports the subset used
+    for tool parameters: type, required, properties.*.type and boolean
+    additionalProperties (annotations such as description are ignored).
+    Schemas using other keywords are rejected at compile time.
+    """
+    if fastjsonschema is not None:
+        return fastjsonschema.compile(schema)
+    
+    _check_schema_subset(schema)
+    properties = schema.get("properties", {})
+    required = tuple(schema.get("required", ()))
+    allow_extra = schema.get("additionalProperties", True) is not False
+    
+    def validate(data: Dict[str, Any]) -> Dict[str, Any]:
+        if "type" in schema and not _schema_type_ok(data, schema["type"]):
+            raise ValueError(f"data must be {schema['type']}")
+        if not isinstance(data, dict):
+            # Tool parameters are passed as keyword arguments, so only objects apply
+            raise ValueError("data must be object")
+        for key in required:
+            if key not in data:
+                raise ValueError(f"data must contain ['{key}'] properties")
+        for key, value in data.items():
+            prop = properties.get(key)
+            if prop is None:
+                if not allow_extra:
+                    raise ValueError(f"data must not contain {{'{key}'}} properties")
+            elif "type" in prop and not _schema_type_ok(value, prop["type"]):
+                raise ValueError(f"data.{key} must be {prop['type']}")
+        return data
+    
+    return validate
+
 
 class ModuleType(Enum):
     RETRIEVAL = "Retrieval"
@@ -23,14 +217,29 @@ class ModuleType(Enum):
 class LoopTrace:
     """Record of a single CCAM loop iteration"""
     loop_id: str
-    timestamp: str
+    timestamp: int  # ns since epoch, see _ts()
     module: str
-    input_state: Dict[str, Any]
-    output_state: Dict[str, Any]
+    input_state: Mapping[str, Any]
+    output_state: Mapping[str, Any]
     decision: Optional[str] = None
     validation_result: Optional[bool] = None
     evidence_refs: Optional[List[str]] = None
 
+    def __post_init__(self):
+        # State dicts are kept by reference (later annotations such as
+        # control_validated must show up in the audit log); their literal
+        # keys are already interned
+        self.module = sys.intern(self.module)
+
+
+@dataclass
+class StoreEntry:
+    """Single Memory store value with provenance"""
+    __slots__ = ("value", "timestamp", "evidence_id")
+    value: Any
+    timestamp: int
+    evidence_id: Optional[str]
+
 
 class MetaPrompt:
     """
@@ -64,24 +273,52 @@ class MetaPrompt:
         - Wait for Control validation before execution
         """
     
-    def validate(self, cognition_output: Dict[str, Any]) -> tuple[bool, str]:
+    def validate(self, cognition_output: Mapping[str, Any]) -> Tuple[bool, str]:
         """Validate Cognition output against symbolic rules"""
-        issues = []
-        
-        # Check evidence citation
-        if self.rules["must_cite_stored_evidence"]:
-            if not cognition_output.get("evidence_refs"):
-                issues.append("Missing evidence citations")
-        
-        # Check final action constraint
-        if cognition_output.get("is_final_action"):
-            if not cognition_output.get("control_validated"):
-                issues.append("Final action without Control validation")
-        
-        is_valid = len(issues) == 0
-        message = "PASS" if is_valid else f"VIOLATIONS: {'; '.join(issues)}"
-        
-        return is_valid, message
+        return check_output(cognition_output, bool(self.rules.get("must_cite_stored_evidence")))
+
+
+class EvidenceCache(dict):
+    """
+    Bounded LRU mapping of evidence ID -> tool result
+    Evicts the least recently stored/used entry once maxsize is exceeded.
+    Recency is tracked separately, so iteration keeps insertion order and
+    lookups never reorder available_evidence in the Cognition prompt
+    """
+    
+    def __init__(self, maxsize: int = 4096):
+        super().__init__()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._recency: "OrderedDict[str, None]" = OrderedDict()  # Oldest first
+    
+    def __setitem__(self, key: str, value: Any):
+        super().__setitem__(key, value)
+        self._recency[key] = None
+        self._recency.move_to_end(key)
+        if len(self) > self.maxsize:
+            oldest, _ = self._recency.popitem(last=False)
+            super().__delitem__(oldest)
+    
+    def __delitem__(self, key: str):
+        super().__delitem__(key)
+        del self._recency[key]
+    
+    def contains(self, key: str) -> bool:
+        """Membership test that updates hit/miss counters"""
+        if key in self:
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+    
+    def lookup(self, key: str) -> Optional[Any]:
+        """Return a cached result and mark it most recently used"""
+        if not self.contains(key):
+            return None
+        self._recency.move_to_end(key)
+        return self[key]
 
 
 class Memory:
@@ -90,46 +327,84 @@ class Memory:
     Maintains state persistence across loops with audit trail
     """
     
-    def __init__(self):
-        self.store: Dict[str, Any] = {}
-        self.history: List[LoopTrace] = []
-        self.evidence_cache: Dict[str, Any] = {}
+    def __init__(
+        self,
+        evidence_cache_size: int = 4096,
+        audit_path: Optional[str] = None,  # Stream every trace to this JSONL file
+        history_limit: Optional[int] = None  # Keep only the last N traces in RAM
+    ):
+        self.store: Dict[str, StoreEntry] = {}
+        self.history: Deque[LoopTrace] = deque(maxlen=history_limit)
+        # Field views of history, for export
+        self._trace_dicts: Deque[Dict[str, Any]] = deque(maxlen=history_limit)
+        self.trace_count = 0  # All traces logged, including ones dropped from history
+        self._audit_fp = open(audit_path, "ab") if audit_path else None
+        self.evidence_cache = EvidenceCache(maxsize=evidence_cache_size)
+        self.violation_count = 0  # Traces that failed Control validation
+        self._store_version = 0  # Bumped on every store/evidence mutation
+        # (store version, stored_values, available_evidence) for get_state_summary
+        self._summary_cache: Optional[Tuple[int, Dict[str, Any], List[str]]] = None
         
     def write(self, key: str, value: Any, evidence_id: Optional[str] = None):
         """Store state with optional evidence reference"""
-        self.store[key] = {
-            "value": value,
-            "timestamp": datetime.now().isoformat(),
-            "evidence_id": evidence_id
-        }
+        self.store[key] = StoreEntry(value, _ts(), evidence_id)
+        self._store_version += 1
         
     def read(self, key: str) -> Optional[Any]:
         """Retrieve stored state"""
         entry = self.store.get(key)
-        return entry["value"] if entry else None
+        return entry.value if entry else None
     
     def has_evidence(self, evidence_id: str) -> bool:
         """Check if evidence already exists (avoid redundant calls)"""
-        return evidence_id in self.evidence_cache
+        return self.evidence_cache.contains(evidence_id)
     
     def store_evidence(self, evidence_id: str, data: Any):
         """Cache retrieved evidence"""
         self.evidence_cache[evidence_id] = data
+        self._store_version += 1
     
     def get_evidence(self, evidence_id: str) -> Optional[Any]:
         """Retrieve cached evidence"""
-        return self.evidence_cache.get(evidence_id)
+        return self.evidence_cache.lookup(evidence_id)
     
     def log_trace(self, trace: LoopTrace):
         """Append to audit log"""
         self.history.append(trace)
+        # LoopTrace holds no nested dataclasses, so its __dict__ is the asdict() view
+        self._trace_dicts.append(trace.__dict__)
+        self.trace_count += 1
+        if trace.validation_result is False:
+            self.violation_count += 1
+        if self._audit_fp is not None:
+            self._audit_fp.write(_dumps_line(
+                {**trace.__dict__, "timestamp": _format_ts(trace.timestamp)}
+            ))
+    
+    def flush(self):
+        """Flush the streamed audit log, if any"""
+        if self._audit_fp is not None:
+            self._audit_fp.flush()
+    
+    def close(self):
+        """Close the streamed audit log, if any"""
+        if self._audit_fp is not None:
+            self._audit_fp.close()
+            self._audit_fp = None
     
     def get_state_summary(self) -> Dict[str, Any]:
-        """Return current state for Cognition context"""
+        """Return current state for Cognition context (nested values are shared, do not mutate)"""
+        if self._summary_cache is None or self._summary_cache[0] != self._store_version:
+            self._summary_cache = (
+                self._store_version,
+                {k: v.value for k, v in self.store.items()},
+                list(self.evidence_cache.keys())
+            )
+        _, stored_values, available_evidence = self._summary_cache
         return {
-            "stored_values": {k: v["value"] for k, v in self.store.items()},
-            "available_evidence": list(self.evidence_cache.keys()),
-            "loop_count": len(self.history)
+            "stored_values": stored_values,
+            "available_evidence": available_evidence,
+            "loop_count": self.trace_count
         }
 
 
@@ -137,22 +412,63 @@ class ToolRegistry:
     """Registry of available tools for Action module"""
     
     def __init__(self):
-        self.tools: Dict[str, Callable] = {}
+        self.tools: Dict[str, Dict[str, Any]] = {}
+        self._descriptions_json: Optional[str] = None
         
-    def register(self, name: str, func: Callable, description: str):
-        """Register a tool with metadata"""
+    def register(
+        self,
+        name: str,
+        func: Callable,
+        description: str,
+        schema: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Register a tool with metadata and an optional parameter JSON-Schema
+        Without fastjsonschema installed only the compile_schema() subset is
+        supported; schemas using other keywords (enum, minimum, items, ...)
+        raise ValueError here rather than being silently ignored
+        """
         self.tools[name] = {
             "function": func,
             "description": description,
-            "name": name
+            "name": name,
+            "schema": schema,
+            "validator": compile_schema(schema) if schema else None
         }
+        self._descriptions_json = None  # Invalidate serialized descriptions
+    
+    def freeze(self) -> str:
+        """Pre-serialize tool descriptions for prompt construction"""
+        self._descriptions_json = _dumps_pretty(self.get_tool_descriptions())
+        return self._descriptions_json
     
     def get_tool_descriptions(self) -> List[Dict[str, str]]:
         """Return list of available tools for Cognition"""
-        return [
-            {"name": t["name"], "description": t["description"]}
-            for t in self.tools.values()
-        ]
+        descriptions = []
+        for t in self.tools.values():
+            description = {"name": t["name"], "description": t["description"]}
+            if t["schema"]:
+                description["parameters"] = t["schema"]
+            descriptions.append(description)
+        return descriptions
+    
+    def validate_parameters(self, tool_name: str, parameters: Dict[str, Any]) -> Optional[str]:
+        """Check parameters against the tool's schema; return an error or None"""
+        tool = self.tools.get(tool_name)
+        if tool is None:
+            return f"Tool '{tool_name}' not registered"
+        if tool["validator"] is not None:
+            try:
+                tool["validator"](parameters)
+            except ValueError as e:
+                return str(e)
+        return None
+    
+    def get_tool_descriptions_json(self) -> str:
+        """Return tool descriptions as JSON (cached until the next register)"""
+        if self._descriptions_json is None:
+            return self.freeze()
+        return self._descriptions_json
     
     def execute(self, tool_name: str, **kwargs) -> Any:
         """Execute a registered tool"""
@@ -163,34 +479,270 @@ class ToolRegistry:
         return func(**kwargs)
 
 
+class LLMResponseCache:
+    """
+    Bounded LRU cache of cognition engine responses with expiry
+    Keyed by a SHA-256 digest of the prompt minus its loop counter, so
+    re-entries with unchanged state and context skip the LLM round-trip
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+    
+    @staticmethod
+    def key(prompt: str) -> str:
+        """Stable cache key for a prompt"""
+        return hashlib.sha256(prompt.encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return a cached response, or None if absent or expired"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+    
+    def put(self, key: str, response: Any):
+        """Store a response, evicting the least recently used entry if full"""
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SemanticResponseCache:
+    """
+    Near-duplicate cache of cognition engine responses
+    Entries are partitioned by an exact key for the invariant prompt parts
+    (instructions, tools, Memory state); within a partition only the short,
+    varying text (the loop context) is embedded with a sentence-transformers
+    model, and a lookup returns the response of the most similar entry if its
+    cosine similarity reaches the threshold. Requires numpy and
+    sentence-transformers.
+    """
+    
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        maxsize: int = 1024,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2"
+    ):
+        # Imported here: both are heavy and only needed when this cache is enabled
+        import numpy as np  # type: ignore[import-not-found]
+        from sentence_transformers import SentenceTransformer  # type: ignore[import-not-found]
+        
+        self._np = np
+        self._model = SentenceTransformer(model_name)
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        dim = self._model.get_sentence_embedding_dimension()
+        self._embeds = np.zeros((maxsize, dim), dtype=np.float32)  # Unit-norm rows
+        self._partitions = np.zeros(maxsize, dtype=np.int64)
+        self._responses: List[Any] = [None] * maxsize
+        self._size = 0
+        self._next = 0  # Ring-buffer slot overwritten by the next put()
+    
+    def embed(self, text: str):
+        """Unit-normalized embedding of the varying prompt text"""
+        return self._model.encode(text, normalize_embeddings=True).astype(self._np.float32)
+    
+    def get(self, partition: int, query) -> Optional[Any]:
+        """Return the closest response within partition, or None below threshold"""
+        if self._size:
+            scores = self._embeds[:self._size] @ query
+            scores[self._partitions[:self._size] != partition] = -2.0  # Below any cosine
+            best = int(scores.argmax())
+            if scores[best] >= self.threshold:
+                self.hits += 1
+                return self._responses[best]
+        self.misses += 1
+        return None
+    
+    def put(self, partition: int, query, response: Any):
+        """Store a response, overwriting the oldest entry if full"""
+        self._partitions[self._next] = partition
+        self._embeds[self._next] = query
+        self._responses[self._next] = response
+        self._next = (self._next + 1) % self.maxsize
+        self._size = min(self._size + 1, self.maxsize)
+    
+    def __len__(self) -> int:
+        return self._size
+
+
+class ProposedAction(TypedDict, total=False):
+    """Tool call proposed by Cognition (single call or a parallel batch)"""
+    tool_name: str
+    parameters: Dict[str, Any]
+    parallel_calls: List[Dict[str, Any]]
+
+
+class CognitionOutput(TypedDict, total=False):
+    """Cognition engine response; engines may add further keys"""
+    reasoning: str
+    proposed_action: ProposedAction
+    evidence_refs: List[str]
+    is_final_action: bool
+    control_validated: bool
+
+
+# A recorded tool call: (tool_name, parameters)
+ToolCall = Tuple[str, Dict[str, Any]]
+
+
+class JITPlanner:
+    """
+    Trace-based plan cache for recurring task templates
+    The first run of a template goes through the interpreted CCAM loop while
+    its read-only tool calls are recorded; later runs of the same template
+    replay those calls concurrently before the loop starts
+    """
+    
+    def __init__(self, readonly_tools: Iterable[str], max_workers: int = 8):
+        self.readonly_tools = frozenset(readonly_tools)
+        self.max_workers = max_workers
+        self._plan_cache: Dict[str, Callable[[ToolRegistry], List[Tuple[str, Dict[str, Any], Any]]]] = {}
+    
+    @staticmethod
+    def template_key(task: str, retrieval_plan: Dict[str, Any]) -> str:
+        """Identify a task template by its task text and retrieval plan structure"""
+        payload = json.dumps([task, retrieval_plan], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[Callable]:
+        """Return the compiled plan for a template, if one was recorded"""
+        return self._plan_cache.get(key)
+    
+    def record(self, key: str, calls: List[ToolCall]):
+        """Compile and cache the read-only calls observed for a template"""
+        calls = [(name, params) for name, params in calls if name in self.readonly_tools]
+        if calls:
+            self._plan_cache[key] = self.compile(calls)
+    
+    def compile(self, calls: List[ToolCall]) -> Callable[[ToolRegistry], List[Tuple[str, Dict[str, Any], Any]]]:
+        """
+        Build a plan that issues all calls concurrently
+        Failed calls are dropped; the CCAM loop will request them again
+        """
+        frozen_calls = tuple(calls)
+        max_workers = min(self.max_workers, len(frozen_calls))
+        
+        def plan(tools: ToolRegistry) -> List[Tuple[str, Dict[str, Any], Any]]:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [
+                    executor.submit(tools.execute, name, **params)
+                    for name, params in frozen_calls
+                ]
+            results = []
+            for (name, params), future in zip(frozen_calls, futures):
+                if future.exception() is None:
+                    results.append((name, params, future.result()))
+            return results
+        
+        return plan
+
+
 class StructuredCognitiveLoop:
     """
     Main Structured Cognitive Loop (SCL) Architecture
     Implements R-CCAM loop with Soft Symbolic Control
     """
     
+    # Cognition prompt skeleton; only the state and context vary per loop
+    _PROMPT_TEMPLATE = """
+        {instructions}
+        
+        CURRENT STATE:
+        {state}
+        
+        AVAILABLE TOOLS:
+        {tools}
+        
+        CONTEXT:
+        {context}
+        
+        Based on the above, determine:
+        1. What is the next action needed?
+        2. What evidence supports this decision?
+        3. Are all conditions for this action met?
+        
+        Respond in JSON format with:
+        - reasoning: your thought process
+        - proposed_action: {{tool_name, parameters}}
+        - evidence_refs: list of evidence IDs used
+        - is_final_action: boolean
+        """
+    
     def __init__(
         self,
         cognition_engine: Callable,  # LLM inference function
         tool_registry: ToolRegistry,
         metaprompt: Optional[MetaPrompt] = None,
-        max_loops: int = 20
+        max_loops: int = 20,
+        llm_cache_size: int = 0,  # >0 enables response caching (stateless engines only)
+        llm_cache_ttl: float = 3600.0,
+        jit_planner: Optional[JITPlanner] = None,
+        max_parallel_calls: int = 8,
+        audit_path: Optional[str] = None,  # JSONL file receiving each trace as logged
+        history_limit: Optional[int] = None,  # None keeps the full history in memory
+        enable_semantic_cache: bool = False,  # Needs numpy + sentence-transformers
+        semantic_cache_threshold: float = 0.85
     ):
         self.cognition_engine = cognition_engine
         self.tools = tool_registry
         self.metaprompt = metaprompt or MetaPrompt()
-        self.memory = Memory()
+        self.memory = Memory(audit_path=audit_path, history_limit=history_limit)
         self.max_loops = max_loops
+        self.max_parallel_calls = max_parallel_calls
         self.loop_counter = 0
         
+        # Tool descriptions are invariant across loops; serialize them once
+        self.tools.freeze()
+        
+        self._llm_cache = (
+            LLMResponseCache(maxsize=llm_cache_size, ttl=llm_cache_ttl)
+            if llm_cache_size > 0 else None
+        )
+        self._semantic_cache = (
+            SemanticResponseCache(threshold=semantic_cache_threshold)
+            if enable_semantic_cache else None
+        )
+        
+        self.jit_planner = jit_planner
+        self._jit_trace: List[ToolCall] = []  # Tool calls executed this run
+        
+        self._prompt_builder: Optional[Callable[[str, str], str]] = None
+        self._prompt_builder_key: Optional[Tuple[str, str]] = None
+    
+    def close(self):
+        """Release resources held by Memory (the streamed audit log, if any)"""
+        self.memory.close()
+    
+    def __enter__(self) -> "StructuredCognitiveLoop":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+        
     def retrieval(self, task: str) -> Dict[str, Any]:
         """
         Retrieval Module (invoked once at task start)
         Performs initial evidence gathering and task decomposition
         """
-        print(f"\n{'='*60}")
-        print(f"[RETRIEVAL] Initializing task: {task[:100]}...")
-        print(f"{'='*60}\n")
+        logger.info("\n%s\n[RETRIEVAL] Initializing task: %s...\n%s\n", _RULE_EQ, task[:100], _RULE_EQ)
         
         # Simulate retrieval planning (in real implementation, call LLM)
         plan = {
@@ -206,7 +758,7 @@ class StructuredCognitiveLoop:
         
         trace = LoopTrace(
             loop_id="R-001",
-            timestamp=datetime.now().isoformat(),
+            timestamp=_ts(),
             module=ModuleType.RETRIEVAL.value,
             input_state={"task": task},
             output_state=plan
@@ -215,7 +767,71 @@ class StructuredCognitiveLoop:
         
         return plan
     
-    def cognition(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _get_prompt_builder(self) -> Callable[[str, str], str]:
+        """
+        Return a prompt builder specialized for the current instructions and tools
+        The invariant parts of _PROMPT_TEMPLATE are rendered once and closed
+        over, so each loop only concatenates state and context; the builder
+        is rebuilt when the instructions or registered tools change
+        """
+        key = (self.metaprompt.instructions, self.tools.get_tool_descriptions_json())
+        if self._prompt_builder is not None and key == self._prompt_builder_key:
+            return self._prompt_builder
+        
+        state_marker, context_marker = "\0STATE\0", "\0CONTEXT\0"
+        rendered = self._PROMPT_TEMPLATE.format(
+            instructions=key[0],
+            tools=key[1],
+            state=state_marker,
+            context=context_marker
+        )
+        head, rest = rendered.split(state_marker)
+        middle, tail = rest.split(context_marker)
+        
+        def build_prompt(state: str, context: str) -> str:
+            return head + state + middle + context + tail
+        
+        self._prompt_builder = build_prompt
+        self._prompt_builder_key = key
+        return self._prompt_builder
+    
+    def _call_cognition_engine(
+        self,
+        prompt: str,
+        context: Dict[str, Any],
+        cache_key: Optional[str] = None,
+        semantic_key: Optional[Tuple[int, str]] = None  # (partition, varying text)
+    ) -> CognitionOutput:
+        """
+        Call the cognition engine (LLM), reusing the response for a repeated
+        prompt or, with the semantic cache enabled, a near-identical one
+        A cache hit skips the engine call entirely, so the caches suit engines
+        whose response depends on the prompt alone (not on internal state)
+        """
+        llm_cache = self._llm_cache if cache_key is not None else None
+        if llm_cache is not None and cache_key is not None:
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                # Control annotates the response in place, so hand out a copy
+                return cached.copy()
+        
+        semantic_cache = self._semantic_cache if semantic_key is not None else None
+        query = None
+        if semantic_cache is not None and semantic_key is not None:
+            partition, text = semantic_key
+            query = semantic_cache.embed(text)
+            cached = semantic_cache.get(partition, query)
+            if cached is not None:
+                return cached.copy()
+        
+        response: CognitionOutput = self.cognition_engine(prompt, context)
+        if llm_cache is not None and cache_key is not None:
+            llm_cache.put(cache_key, response.copy())
+        if semantic_cache is not None and query is not None:
+            semantic_cache.put(partition, query, response.copy())
+        return response
+    
+    def cognition(self, context: Dict[str, Any]) -> CognitionOutput:
         """
         Cognition Module (probabilistic inference under symbolic constraints)
         Generates reasoning and action proposals
@@ -223,46 +839,36 @@ class StructuredCognitiveLoop:
         self.loop_counter += 1
         loop_id = f"CCAM-{self.loop_counter:03d}"
         
-        print(f"\n[COGNITION] Loop {self.loop_counter}")
-        print(f"{'─'*60}")
+        logger.info("\n[COGNITION] Loop %d\n%s", self.loop_counter, _RULE_DASH)
         
         # Construct prompt with Metaprompt + Memory state
         state_summary = self.memory.get_state_summary()
-        available_tools = self.tools.get_tool_descriptions()
-        
-        cognition_prompt = f"""
-        {self.metaprompt.instructions}
         
-        CURRENT STATE:
-        {json.dumps(state_summary, indent=2)}
+        build_prompt = self._get_prompt_builder()
+        context_json = _dumps_pretty(context)
+        cognition_prompt = build_prompt(_dumps_pretty(state_summary), context_json)
         
-        AVAILABLE TOOLS:
-        {json.dumps(available_tools, indent=2)}
+        cache_key = semantic_key = None
+        if self._llm_cache is not None or self._semantic_cache is not None:
+            # loop_count differs on every loop; key on the parts of the prompt that can repeat
+            stable_state = {k: v for k, v in state_summary.items() if k != "loop_count"}
+            stable_state_json = _dumps_pretty(stable_state)
+            if self._llm_cache is not None:
+                cache_key = self._llm_cache.key(build_prompt(stable_state_json, context_json))
+            if self._semantic_cache is not None:
+                # Near matches only count under identical instructions, tools and state
+                semantic_key = (hash(build_prompt(stable_state_json, "")), context_json)
         
-        CONTEXT:
-        {json.dumps(context, indent=2)}
+        response = self._call_cognition_engine(cognition_prompt, context, cache_key, semantic_key)
         
-        Based on the above, determine:
-        1. What is the next action needed?
-        2. What evidence supports this decision?
-        3. Are all conditions for this action met?
-        
-        Respond in JSON format with:
-        - reasoning: your thought process
-        - proposed_action: {{tool_name, parameters}}
-        - evidence_refs: list of evidence IDs used
-        - is_final_action: boolean
-        """
-        
-        # Call cognition engine (LLM)
-        response = self.cognition_engine(cognition_prompt, context)
-        
-        print(f"Reasoning: {response.get('reasoning', 'N/A')}")
-        print(f"Proposed Action: {response.get('proposed_action', 'N/A')}")
+        logger.info(
+            "Reasoning: %s\nProposed Action: %s",
+            response.get('reasoning', 'N/A'), response.get('proposed_action', 'N/A')
+        )
         
         trace = LoopTrace(
             loop_id=loop_id,
-            timestamp=datetime.now().isoformat(),
+            timestamp=_ts(),
             module=ModuleType.COGNITION.value,
             input_state=context,
             output_state=response,
@@ -272,12 +878,17 @@ class StructuredCognitiveLoop:
         
         return response
     
-    def control(self, cognition_output: Dict[str, Any]) -> tuple[bool, str]:
+    def control(self, cognition_output: CognitionOutput) -> Tuple[bool, str]:
         """
         Control Module (Soft Symbolic Validation)
         Validates Cognition output against Metaprompt rules
         """
-        print(f"\n[CONTROL] Validating proposed action...")
+        is_valid, message, _ = self._control(cognition_output)
+        return is_valid, message
+    
+    def _control(self, cognition_output: CognitionOutput) -> Tuple[bool, str, List[str]]:
+        """control(), also returning the evidence IDs of the proposed calls"""
+        logger.info("\n[CONTROL] Validating proposed action...")
         
         # For final actions, mark as control_validated to pass Metaprompt check
         if cognition_output.get("is_final_action"):
@@ -287,20 +898,44 @@ class StructuredCognitiveLoop:
         is_valid, message = self.metaprompt.validate(cognition_output)
         
         # Additional safety checks
-        proposed_action = cognition_output.get("proposed_action", {})
-        tool_name = proposed_action.get("tool_name")
+        proposed_action: ProposedAction = cognition_output.get("proposed_action") or {}
+        
+        calls: List[Mapping[str, Any]] = []
+        if proposed_action.get("parallel_calls"):
+            calls.extend(proposed_action["parallel_calls"])
+        elif proposed_action.get("tool_name"):
+            calls.append(proposed_action)
+        # Bind each call's name and parameters once for both checks
+        bound_calls = [(call.get("tool_name"), call.get("parameters", {})) for call in calls]
         
-        # Check for redundant tool calls
-        if tool_name:
-            evidence_id = f"evidence_{tool_name}_{json.dumps(proposed_action.get('parameters', {}), sort_keys=True)}"
+        # Check tool parameters before anything is executed
+        for tool_name, parameters in bound_calls:
+            if not tool_name:
+                is_valid = False
+                message = "REJECTED: Batched call without tool_name"
+                break
+            error = self.tools.validate_parameters(tool_name, parameters)
+            if error is not None:
+                is_valid = False
+                message = f"REJECTED: Invalid parameters for {tool_name} ({error})"
+                break
+        
+        # Canonicalize once; run() hands these IDs to action() to store the results
+        evidence_ids = [
+            make_evidence_id(tool_name, parameters) for tool_name, parameters in bound_calls if tool_name
+        ]
+        
+        # Check for redundant tool calls (single or batched)
+        for evidence_id in evidence_ids:
             if self.memory.has_evidence(evidence_id):
                 is_valid = False
                 message = "REJECTED: Redundant tool call (evidence already in Memory)"
+                break
         
         # Log control decision
         trace = LoopTrace(
             loop_id=f"CTL-{self.loop_counter:03d}",
-            timestamp=datetime.now().isoformat(),
+            timestamp=_ts(),
             module=ModuleType.CONTROL.value,
             input_state=cognition_output,
             output_state={"validation": is_valid, "message": message},
@@ -309,58 +944,126 @@ class StructuredCognitiveLoop:
         self.memory.log_trace(trace)
         
         status = "✓ PASS" if is_valid else "✗ FAIL"
-        print(f"{status}: {message}")
+        logger.info("%s: %s", status, message)
         
-        return is_valid, message
+        return is_valid, message, evidence_ids
     
-    def action(self, cognition_output: Dict[str, Any]) -> Any:
+    def action(
+        self,
+        cognition_output: CognitionOutput,
+        evidence_ids: Optional[List[str]] = None  # From Control; recomputed if omitted
+    ) -> Any:
         """
         Action Module (Separated Execution)
         Executes validated actions and interacts with external environment
         """
-        print(f"\n[ACTION] Executing validated action...")
+        logger.info("\n[ACTION] Executing validated action...")
         
-        proposed_action = cognition_output.get("proposed_action", {})
+        proposed_action: ProposedAction = cognition_output.get("proposed_action") or {}
         tool_name = proposed_action.get("tool_name")
         parameters = proposed_action.get("parameters", {})
         
+        # Independent tool calls proposed as a batch run concurrently
+        parallel_calls = proposed_action.get("parallel_calls")
+        if parallel_calls:
+            return self._execute_parallel(proposed_action, parallel_calls, evidence_ids)
+        
         if not tool_name:
             return {"status": "no_action", "result": None}
         
-        # Execute tool
+        # Execute tool (only the tool call itself is reported as an action failure)
         try:
             result = self.tools.execute(tool_name, **parameters)
-            
-            # Store result in Memory as evidence
-            evidence_id = f"evidence_{tool_name}_{json.dumps(parameters, sort_keys=True)}"
-            self.memory.store_evidence(evidence_id, result)
-            
-            print(f"Executed: {tool_name}")
-            print(f"Result: {str(result)[:200]}...")
-            
-            trace = LoopTrace(
-                loop_id=f"ACT-{self.loop_counter:03d}",
-                timestamp=datetime.now().isoformat(),
-                module=ModuleType.ACTION.value,
-                input_state=proposed_action,
-                output_state={"result": result, "evidence_id": evidence_id}
-            )
-            self.memory.log_trace(trace)
-            
-            return result
-            
         except Exception as e:
             error_msg = f"Action execution failed: {str(e)}"
-            print(f"✗ ERROR: {error_msg}")
+            logger.info("✗ ERROR: %s", error_msg)
             return {"status": "error", "message": error_msg}
+        
+        # Store result in Memory as evidence
+        evidence_id = evidence_ids[0] if evidence_ids else make_evidence_id(tool_name, parameters)
+        self.memory.store_evidence(evidence_id, result)
+        self._jit_trace.append((tool_name, parameters))
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Executed: %s\nResult: %s...", tool_name, str(result)[:200])
+        
+        trace = LoopTrace(
+            loop_id=f"ACT-{self.loop_counter:03d}",
+            timestamp=_ts(),
+            module=ModuleType.ACTION.value,
+            input_state=proposed_action,
+            output_state={"result": result, "evidence_id": evidence_id}
+        )
+        self.memory.log_trace(trace)
+        
+        return result
+    
+    def _execute_parallel(
+        self,
+        proposed_action: ProposedAction,
+        calls: List[Dict[str, Any]],
+        evidence_ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute a batch of independent tool calls concurrently
+        Returns results keyed by evidence ID
+        """
+        def execute(call: Dict[str, Any]) -> Tuple[str, Dict[str, Any], Any, Optional[str]]:
+            name = call.get("tool_name") or ""
+            params = call.get("parameters", {})
+            try:
+                if not name:
+                    raise ValueError("call has no tool_name")
+                return name, params, self.tools.execute(name, **params), None
+            except Exception as e:
+                return name, params, None, f"Action execution failed: {str(e)}"
+        
+        with ThreadPoolExecutor(max_workers=min(self.max_parallel_calls, len(calls))) as executor:
+            outcomes = list(executor.map(execute, calls))
+        
+        if evidence_ids is None or len(evidence_ids) != len(outcomes):
+            evidence_ids = [make_evidence_id(name, params) for name, params, _, _ in outcomes]
+        
+        results = {}
+        for evidence_id, (name, params, result, error_msg) in zip(evidence_ids, outcomes):
+            if error_msg is not None:
+                logger.info("✗ ERROR: %s", error_msg)
+                results[evidence_id] = {"status": "error", "message": error_msg}
+                continue
+            
+            # Store result in Memory as evidence
+            self.memory.store_evidence(evidence_id, result)
+            self._jit_trace.append((name, params))
+            results[evidence_id] = result
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Executed %d calls in parallel\nResult: %s...", len(calls), str(results)[:200])
+        
+        trace = LoopTrace(
+            loop_id=f"ACT-{self.loop_counter:03d}",
+            timestamp=_ts(),
+            module=ModuleType.ACTION.value,
+            input_state=proposed_action,
+            output_state={"results": results}
+        )
+        self.memory.log_trace(trace)
+        
+        return results
     
-    def run(self, task: str) -> Dict[str, Any]:
+    def run(
+        self,
+        task: str,
+        plan: Optional[Callable[[ToolRegistry], List[Tuple[str, Dict[str, Any], Any]]]] = None
+    ) -> Dict[str, Any]:
         """
         Main execution loop: Retrieval → CCAM cycles → Final result
+        A plan (see JITPlanner.compile) given here is replayed right after
+        Retrieval in place of a JIT-compiled one
         """
-        print(f"\n{'#'*60}")
-        print(f"# STRUCTURED COGNITIVE LOOP (SCL) EXECUTION")
-        print(f"{'#'*60}")
+        logger.info("\n%s\n# STRUCTURED COGNITIVE LOOP (SCL) EXECUTION\n%s", _RULE_HASH, _RULE_HASH)
+        
+        # Tool calls recorded for the JIT planner cover this run only
+        self._jit_trace = []
         
         # Step 1: Retrieval (once)
         retrieval_result = self.retrieval(task)
@@ -372,20 +1075,29 @@ class StructuredCognitiveLoop:
             "status": "in_progress"
         }
         
+        # Replay the given plan, or a compiled plan for a known task template
+        template_key = None
+        if plan is None and self.jit_planner is not None:
+            template_key = self.jit_planner.template_key(task, retrieval_result)
+            plan = self.jit_planner.get(template_key)
+        if plan is not None:
+            context["prefetched_evidence"] = self._run_plan(plan)
+        
+        completed = False
         while self.loop_counter < self.max_loops:
             # Cognition
             cognition_output = self.cognition(context)
             
             # Control
-            is_valid, validation_msg = self.control(cognition_output)
+            is_valid, validation_msg, evidence_ids = self._control(cognition_output)
             
             if not is_valid:
-                print(f"\n⚠️  Control rejected action. Re-entering Cognition...")
+                logger.info("\n⚠️  Control rejected action. Re-entering Cognition...")
                 context["last_rejection"] = validation_msg
                 continue
             
             # Action
-            action_result = self.action(cognition_output)
+            action_result = self.action(cognition_output, evidence_ids)
             
             # Memory (implicit - already logged in each module)
             
@@ -394,26 +1106,54 @@ class StructuredCognitiveLoop:
             
             # Check if task is complete
             if cognition_output.get("is_final_action"):
-                print(f"\n{'='*60}")
-                print(f"[COMPLETION] Task finished in {self.loop_counter} loops")
-                print(f"{'='*60}\n")
+                logger.info("\n%s\n[COMPLETION] Task finished in %d loops\n%s\n", _RULE_EQ, self.loop_counter, _RULE_EQ)
+                completed = True
                 break
         
+        # Compile the evidence-gathering calls of a successful interpreted run
+        jit_planner = self.jit_planner
+        if jit_planner is not None and template_key is not None and plan is None and completed:
+            jit_planner.record(template_key, self._jit_trace)
+        
         # Generate final audit log
+        self.memory.flush()
         return self._generate_audit_report()
     
+    def _run_plan(self, plan: Callable) -> List[Any]:
+        """Execute a compiled plan and record its results as Action evidence"""
+        logger.info("\n[ACTION] Replaying compiled plan...")
+        
+        results = []
+        for i, (tool_name, parameters, result) in enumerate(plan(self.tools), 1):
+            evidence_id = make_evidence_id(tool_name, parameters)
+            self.memory.store_evidence(evidence_id, result)
+            
+            logger.info("Executed: %s %s", tool_name, parameters)
+            
+            trace = LoopTrace(
+                loop_id=f"JIT-{i:03d}",
+                timestamp=_ts(),
+                module=ModuleType.ACTION.value,
+                input_state={"tool_name": tool_name, "parameters": parameters},
+                output_state={"result": result, "evidence_id": evidence_id}
+            )
+            self.memory.log_trace(trace)
+            results.append(result)
+        
+        return results
+    
     def _generate_audit_report(self) -> Dict[str, Any]:
         """Generate comprehensive audit log in format shown in paper"""
         report = {
             "task": self.memory.read("task"),
             "policies": list(self.metaprompt.rules.keys()),
-            "log": [asdict(trace) for trace in self.memory.history],
+            "log": [
+                {**fields, "timestamp": _format_ts(fields["timestamp"])}
+                for fields in self.memory._trace_dicts
+            ],
             "summary": {
                 "total_loops": self.loop_counter,
-                "policy_violations": sum(
-                    1 for t in self.memory.history 
-                    if t.validation_result is False
-                ),
+                "policy_violations": self.memory.violation_count,
                 "final_state": self.memory.get_state_summary()
             }
         }
@@ -422,6 +1162,10 @@ class StructuredCognitiveLoop:
 
 def save_audit_log(report: Dict[str, Any], filename: str = "execution_audit.json"):
     """Save audit log to JSON file"""
-    with open(filename, 'w') as f:
-        json.dump(report, f, indent=2)
-    print(f"\n✓ Audit log saved to {filename}")
+    if orjson is not None:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(report, option=_ORJSON_OPTS | orjson.OPT_INDENT_2))
+    else:
+        with open(filename, 'w') as f:
+            json.dump(report, f, indent=2)
+    logger.info("\n✓ Audit log saved to %s", filename)